@@ -16,18 +16,36 @@ The goal of the game is to gather enough ore to spawn the boss.  Once the boss
 is defeated the game will display a victory message.  A basic day/night cycle
 spawns zombies during the night to keep the player on their toes.
 
-This file can be run directly using ``python game.py`` provided that pygame
-is installed.  It expects a ``resources`` folder in the same directory
+This file can be run directly using ``python game.py`` provided that pygame and
+numpy are installed.  It expects a ``resources`` folder in the same directory
 containing several PNG images: dirt.png, grass.png, stone.png, ore.png,
 wood.png, player.png, enemy.png and boss.png.  These assets are scaled
-dynamically to fit the configured tile size.
+dynamically to fit the configured tile size.  If numba is installed the
+collision code is JIT-compiled; without it the same code runs as plain Python.
 """
 
 import os
 import sys
 import random
+from collections import OrderedDict
+
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional – fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# numba's on-disk cache needs the source file next to it, which a frozen
+# (PyInstaller) build does not have, so only cache when running from source.
+# Without a cache every launch would JIT-compile the kernels, so the Windows
+# builds leave numba out and use the plain Python fallback.
+NUMBA_CACHE = not getattr(sys, 'frozen', False)
+
 
 # -----------------------------------------------------------------------------
 # Configuration constants
@@ -46,16 +64,52 @@ PLAYER_JUMP = 12     # initial upward velocity when jumping
 ENEMY_SPEED = 1.5    # horizontal movement speed of enemies
 ENEMY_JUMP_CHANCE = 0.01  # chance per frame that an enemy will jump
 
+# Velocities are stored as fixed-point integers where FP_ONE equals one pixel
+FP_SHIFT = 8
+FP_ONE = 1 << FP_SHIFT
+GRAVITY_FP = round(GRAVITY * FP_ONE)
+PLAYER_SPEED_FP = PLAYER_SPEED * FP_ONE
+PLAYER_JUMP_FP = PLAYER_JUMP * FP_ONE
+ENEMY_SPEED_FP = round(ENEMY_SPEED * FP_ONE)
+ENEMY_JUMP_FP = round(PLAYER_JUMP_FP * 0.8)
+BOSS_SPEED_FP = round(ENEMY_SPEED_FP * 1.5)
+
 DAY_LENGTH = 60 * 20  # number of frames per half-day (approx 20 seconds at 60 FPS)
 ENEMY_SPAWN_INTERVAL = 4 * 60  # spawn enemy every 4 seconds during night
 BOSS_SPAWN_ORE_COUNT = 10  # number of ore required to spawn the boss
+MAX_ENEMIES = 128    # capacity of the enemy pool
+
+# Image key for each tile id (index 0 is air and has no image)
+TILE_NAMES = (None, 'dirt', 'grass', 'stone', 'ore', 'wood')
+# Inventory item gained by mining each tile id (grass drops dirt)
+TILE_TO_ITEM = (None, 'dirt', 'dirt', 'stone', 'ore', 'wood')
+# Tile id placed for each inventory item
+ITEM_TO_TILE = {'dirt': 1, 'stone': 3, 'ore': 4, 'wood': 5}
+# World bounds in tile coordinates
+WORLD_RECT = pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT)
+
+# Order of items in the hotbar
+HOTBAR_ITEMS = ('dirt', 'stone', 'ore', 'wood')
+HOTBAR_ICON_SIZE = 32  # icon edge in pixels (hotbar slot minus its border)
+
+# Keyboard bindings
+LEFT_KEYS = (pygame.K_a, pygame.K_LEFT)
+RIGHT_KEYS = (pygame.K_d, pygame.K_RIGHT)
+JUMP_KEYS = (pygame.K_w, pygame.K_UP, pygame.K_SPACE)
+SELECT_KEYS = dict(zip((pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4), HOTBAR_ITEMS))
+
+CHUNK_SIZE = 32      # width and height of a cached render chunk in tiles
+MAX_CACHED_CHUNKS = 9  # render chunks kept in memory (a 3×3 area around the view)
+CHUNK_COLORKEY = (255, 0, 255)  # marks air in chunk surfaces; no tile texture uses it
+BLOCK_SIZE = 16      # width and height of a collision block in tiles
+JUMP_BUFFER_FRAMES = 4  # frames a jump key press is remembered while airborne
 
 
 # -----------------------------------------------------------------------------
 # Helper functions
 #
 
-def load_image(name, size=None):
+def load_image(name, size=None, alpha=False, smooth=False):
     """Load an image from the resources folder and optionally scale it.
 
     Parameters
@@ -64,20 +118,44 @@ def load_image(name, size=None):
         Filename inside the resources directory (e.g. 'dirt.png').
     size : tuple[int, int] or None
         Desired width and height.  If None the original image is returned.
+    alpha : bool
+        Keep per‑pixel alpha.  Opaque tiles should leave this off so they use
+        SDL's faster opaque blit path.
+    smooth : bool
+        Scale with bilinear filtering.  The default nearest‑neighbour scaling
+        is faster and keeps pixel art crisp.
 
     Returns
     -------
     pygame.Surface
-        The loaded (and scaled) surface with per‑pixel alpha.
+        The loaded (and scaled) surface converted to the display format.
     """
     base_dir = os.path.dirname(__file__)
     path = os.path.join(base_dir, 'resources', name)
-    image = pygame.image.load(path).convert_alpha()
+    image = pygame.image.load(path)
+    image = image.convert_alpha() if alpha else image.convert()
     if size:
-        image = pygame.transform.smoothscale(image, size)
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        image = scale(image, size)
     return image
 
 
+def surface_walk(deltas, start, low, high):
+    """Return a random walk over ``deltas`` starting at ``start``.
+
+    Every step is clamped to ``[low, high]`` before the next one is applied,
+    so the walk hugs the limits instead of drifting past them.  The walk is
+    one step per column, which plain Python does in microseconds; compiling
+    it would cost far more than it saves.
+    """
+    heights = []
+    current = start
+    for delta in deltas.tolist():
+        current = min(high, max(low, current + delta))
+        heights.append(current)
+    return np.array(heights)
+
+
 def generate_world(width, height):
     """Procedurally generate a simple overworld.
 
@@ -94,49 +172,239 @@ def generate_world(width, height):
 
     Returns
     -------
-    list[list[int]]
-        A 2‑D array of tile identifiers.
+    numpy.ndarray
+        A ``(height, width)`` array of ``uint8`` tile identifiers.
     """
-    world = [[0 for _ in range(width)] for _ in range(height)]
+    rng = np.random.default_rng()
     base = height // 2
-    current_height = base
-    for x in range(width):
-        # Randomly adjust the surface height to create gentle hills
-        current_height += random.choice([-1, 0, 1])
-        current_height = max(base - 4, min(base + 4, current_height))
-        for y in range(current_height, height):
-            if y == current_height:
-                # surface tile: grass
-                world[y][x] = 2
-            elif y < current_height + 5:
-                # just below surface: dirt
-                world[y][x] = 1
-            else:
-                # deeper: stone or ore
-                world[y][x] = 4 if random.random() < 0.05 else 3
-    return world
+    # Randomly adjust the surface height to create gentle hills
+    heights = surface_walk(rng.integers(-1, 2, size=width), base, base - 4, base + 4)
+    y = np.arange(height)[:, None]
+    world = np.select(
+        [
+            y < heights,                        # above the surface: air
+            y == heights,                       # surface tile: grass
+            y < heights + 5,                    # just below surface: dirt
+            rng.random((height, width)) < 0.05,  # deeper: ore ...
+        ],
+        [0, 2, 1, 4],
+        default=3,                              # ... or stone
+    )
+    return world.astype(np.uint8)
+
+
+def find_ground(world):
+    """Return the row of the topmost solid tile in every column."""
+    return (world != 0).argmax(axis=0).astype(np.int32)
+
+
+def update_ground(ground_y, world, x):
+    """Recompute ``ground_y`` for column ``x`` after a tile in it changed."""
+    ground_y[x] = np.argmax(world[:, x] != 0)
 
 
+def spawn_ground(ground_y, centerx, width):
+    """Return the pixel y a ``width``-wide rect centred on ``centerx`` stands on.
+
+    This is the top of the tallest column the rect covers, so the rect does
+    not start inside a neighbouring slope.
+    """
+    left = max(0, (centerx - width // 2) // TILE_SIZE)
+    right = min(len(ground_y) - 1, (centerx - width // 2 + width - 1) // TILE_SIZE)
+    return int(ground_y[left:right + 1].min()) * TILE_SIZE
+
+
+def to_blocks(world):
+    """Return a copy of the world laid out as ``BLOCK_SIZE``² tile blocks.
+
+    The result has shape ``(rows, cols, BLOCK_SIZE, BLOCK_SIZE)`` so the tiles
+    around an entity sit in one or two contiguous 256-byte blocks rather than
+    being spread over many world rows.  The world is padded with air up to a
+    whole number of blocks.  Collision code reads this layout; rendering keeps
+    using the flat world.
+    """
+    height, width = world.shape
+    rows = -(-height // BLOCK_SIZE)
+    cols = -(-width // BLOCK_SIZE)
+    padded = np.zeros((rows * BLOCK_SIZE, cols * BLOCK_SIZE), dtype=world.dtype)
+    padded[:height, :width] = world
+    return padded.reshape(rows, BLOCK_SIZE, cols, BLOCK_SIZE).transpose(0, 2, 1, 3).copy()
+
+
+def update_block(blocks, world, x, y):
+    """Copy tile ``(x, y)`` of the flat world into the blocked layout."""
+    blocks[y // BLOCK_SIZE, x // BLOCK_SIZE, y % BLOCK_SIZE, x % BLOCK_SIZE] = world[y, x]
+
+
+@njit(cache=NUMBA_CACHE)
+def fp_to_px(value):
+    """Convert a fixed-point velocity to whole pixels, truncating toward zero."""
+    return value >> FP_SHIFT if value >= 0 else -(-value >> FP_SHIFT)
+
+
+@njit(cache=NUMBA_CACHE)
 def is_solid(tile_id):
     """Return True if the tile_id corresponds to a solid block."""
     return tile_id != 0
 
 
+@njit(cache=NUMBA_CACHE)
+def _edge_blocked(blocks, tile_x, tile_y):
+    # Tiles outside the world (including block padding) are air
+    rows, cols = blocks.shape[0], blocks.shape[1]
+    if not (0 <= tile_y < rows * BLOCK_SIZE and 0 <= tile_x < cols * BLOCK_SIZE):
+        return False
+    return is_solid(blocks[tile_y // BLOCK_SIZE, tile_x // BLOCK_SIZE,
+                           tile_y % BLOCK_SIZE, tile_x % BLOCK_SIZE])
+
+
+@njit(cache=NUMBA_CACHE)
+def _push_out(blocks, x, y, width, height, dx, dy, vel_y):
+    """Snap a moved rectangle against every solid tile under its corners.
+
+    This is the full four-corner test.  The movement passes assume the
+    rectangle starts clear of terrain, so it is only needed where that can
+    break: when an entity spawns and when a block is placed inside one (see
+    :func:`push_out_rect`).  Only the signs of ``dx`` and ``dy`` matter.
+
+    Returns
+    -------
+    tuple
+        The new ``(x, y, vel_y, on_ground)``.
+    """
+    on_ground = False
+    left = x
+    top = y
+    right = x + width - 1
+    bottom = y + height - 1
+    for corner in range(4):
+        tile_x = (left if corner % 2 == 0 else right) // TILE_SIZE
+        tile_y = (top if corner < 2 else bottom) // TILE_SIZE
+        if _edge_blocked(blocks, tile_x, tile_y):
+            if dy > 0:
+                # Falling – land on the tile below
+                y = tile_y * TILE_SIZE - height
+                vel_y = 0
+                on_ground = True
+            elif dy < 0:
+                # Jumping – bump head on tile above
+                y = (tile_y + 1) * TILE_SIZE
+                vel_y = 0
+            if dx > 0:
+                # Moving right – hit left side of tile
+                x = tile_x * TILE_SIZE - width
+            elif dx < 0:
+                # Moving left – hit right side of tile
+                x = (tile_x + 1) * TILE_SIZE
+    return x, y, vel_y, on_ground
+
+
+@njit(cache=NUMBA_CACHE)
+def move_horizontal(blocks, x, y, width, height, step):
+    """Move a rectangle ``step`` pixels sideways, stopping at solid tiles.
+
+    ``blocks`` is the world in the layout returned by :func:`to_blocks`.
+
+    Only the two corners on the leading edge are tested, and only when that
+    edge crosses into a new tile column; otherwise it is still in the tiles
+    it was already clear of.  Returns the new ``x``.
+    """
+    new_x = x + step
+    if step > 0:
+        tile_x = (new_x + width - 1) // TILE_SIZE
+        if tile_x == (x + width - 1) // TILE_SIZE:
+            return new_x
+        # Moving right – hit left side of tile
+        blocked_x = tile_x * TILE_SIZE - width
+    elif step < 0:
+        tile_x = new_x // TILE_SIZE
+        if tile_x == x // TILE_SIZE:
+            return new_x
+        # Moving left – hit right side of tile
+        blocked_x = (tile_x + 1) * TILE_SIZE
+    else:
+        return x
+    if (_edge_blocked(blocks, tile_x, y // TILE_SIZE)
+            or _edge_blocked(blocks, tile_x, (y + height - 1) // TILE_SIZE)):
+        return blocked_x
+    return new_x
+
+
+@njit(cache=NUMBA_CACHE)
+def move_vertical(blocks, x, y, width, height, step, vel_y):
+    """Move a rectangle ``step`` pixels vertically, stopping at solid tiles.
+
+    The vertical counterpart of :func:`move_horizontal`.  ``vel_y`` is reset
+    to 0 when a tile is hit.
+
+    Returns
+    -------
+    tuple
+        The new ``(y, vel_y, on_ground)``.
+    """
+    new_y = y + step
+    if step > 0:
+        tile_y = (new_y + height - 1) // TILE_SIZE
+        if tile_y == (y + height - 1) // TILE_SIZE:
+            return new_y, vel_y, False
+        # Falling – land on the tile below
+        blocked_y = tile_y * TILE_SIZE - height
+    elif step < 0:
+        tile_y = new_y // TILE_SIZE
+        if tile_y == y // TILE_SIZE:
+            return new_y, vel_y, False
+        # Jumping – bump head on tile above
+        blocked_y = (tile_y + 1) * TILE_SIZE
+    else:
+        return y, vel_y, False
+    if (_edge_blocked(blocks, x // TILE_SIZE, tile_y)
+            or _edge_blocked(blocks, (x + width - 1) // TILE_SIZE, tile_y)):
+        return blocked_y, 0, step > 0
+    return new_y, vel_y, False
+
+
+@njit(cache=NUMBA_CACHE)
+def move_enemies(blocks, indices, x, y, vel_x, vel_y, on_ground, width, height):
+    """Apply one frame of movement and collision to the given pool slots.
+
+    ``x``, ``y``, ``vel_x``, ``vel_y`` and ``on_ground`` are the enemy pool
+    arrays and are updated in place; velocities are fixed point.  Enemies are
+    kept inside the world horizontally.
+    """
+    world_right = WORLD_WIDTH * TILE_SIZE
+    for i in indices:
+        # Horizontal move
+        new_x = move_horizontal(blocks, x[i], y[i], width, height, fp_to_px(vel_x[i]))
+        new_x = min(max(new_x, 0), world_right - width)
+        # Vertical move
+        new_y, new_vel_y, grounded = move_vertical(
+            blocks, new_x, y[i], width, height, fp_to_px(vel_y[i]), vel_y[i])
+        x[i] = new_x
+        y[i] = new_y
+        vel_y[i] = new_vel_y
+        on_ground[i] = grounded
+
+
+def push_out_rect(blocks, rect):
+    """Lift ``rect`` in place until its corners are clear of solid tiles."""
+    rect.y = _push_out(blocks, rect.x, rect.y, rect.width, rect.height, 0, 1, 0)[1]
+
+
 # -----------------------------------------------------------------------------
 # Entity classes
 #
 
-class Player(pygame.sprite.Sprite):
+class Player:
     def __init__(self, x: int, y: int, images: dict[str, pygame.Surface]):
-        super().__init__()
         self.images = images
         self.image = images['player']
         self.rect = self.image.get_rect()
         # Position the rect such that the bottom center is at (x, y)
         self.rect.centerx = x
         self.rect.bottom = y
-        self.vel_x = 0.0
-        self.vel_y = 0.0
+        # Fixed-point velocity (FP_ONE per pixel per frame)
+        self.vel_x_fp = 0
+        self.vel_y_fp = 0
         self.on_ground = False
         self.health = 100
         # Inventory counts for each resource type
@@ -150,77 +418,68 @@ class Player(pygame.sprite.Sprite):
         self.selected = 'dirt'
         # Hurt cooldown to prevent taking continuous damage
         self.hurt_cooldown = 0
+        # Keys currently held, tracked from KEYDOWN/KEYUP events
+        self._keys_down = set()
+        # Frames left in which a jump key tap still triggers a jump, so a tap
+        # shorter than one frame, or one made while on_ground flickers, counts
+        self._jump_buffer = 0
+
+    def handle_event(self, event):
+        """Track keyboard state from a KEYDOWN, KEYUP or focus-loss event."""
+        if event.type == pygame.KEYDOWN:
+            self._keys_down.add(event.key)
+            if event.key in JUMP_KEYS:
+                self._jump_buffer = JUMP_BUFFER_FRAMES
+            # Change selected block with number keys
+            elif event.key in SELECT_KEYS:
+                self.selected = SELECT_KEYS[event.key]
+        elif event.type == pygame.KEYUP:
+            self._keys_down.discard(event.key)
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # Key releases are not delivered while unfocused
+            self._keys_down.clear()
 
     def handle_input(self):
-        keys = pygame.key.get_pressed()
-        self.vel_x = 0
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            self.vel_x = -PLAYER_SPEED
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.vel_x = PLAYER_SPEED
-        # Jump if on ground
-        if (keys[pygame.K_w] or keys[pygame.K_UP] or keys[pygame.K_SPACE]) and self.on_ground:
-            self.vel_y = -PLAYER_JUMP
+        keys = self._keys_down
+        self.vel_x_fp = 0
+        if not keys.isdisjoint(LEFT_KEYS):
+            self.vel_x_fp = -PLAYER_SPEED_FP
+        if not keys.isdisjoint(RIGHT_KEYS):
+            self.vel_x_fp = PLAYER_SPEED_FP
+        # Jump if on ground; a tap is kept for a few frames until it lands
+        if (self._jump_buffer or not keys.isdisjoint(JUMP_KEYS)) and self.on_ground:
+            self.vel_y_fp = -PLAYER_JUMP_FP
             self.on_ground = False
-        # Change selected block with number keys
-        if keys[pygame.K_1]:
-            self.selected = 'dirt'
-        if keys[pygame.K_2]:
-            self.selected = 'stone'
-        if keys[pygame.K_3]:
-            self.selected = 'ore'
-        if keys[pygame.K_4]:
-            self.selected = 'wood'
-
-    def update(self, world):
+            self._jump_buffer = 0
+        elif self._jump_buffer:
+            self._jump_buffer -= 1
+
+    def update(self, blocks):
         # Apply gravity
-        self.vel_y += GRAVITY
+        self.vel_y_fp += GRAVITY_FP
         # Horizontal movement
-        original_x = self.rect.x
-        self.rect.x += int(self.vel_x)
-        self._resolve_collisions(world, dx=self.vel_x, dy=0)
+        self._move_horizontal(blocks)
         # Vertical movement
-        original_y = self.rect.y
-        self.rect.y += int(self.vel_y)
-        self.on_ground = False
-        self._resolve_collisions(world, dx=0, dy=self.vel_y)
+        self._move_vertical(blocks)
         # Hurt cooldown timer
         if self.hurt_cooldown > 0:
             self.hurt_cooldown -= 1
 
-    def _resolve_collisions(self, world, dx: float, dy: float):
-        # Determine which tiles intersect with the player after movement
-        # We'll check the four corners of the player's rectangle
-        corners = [
-            (self.rect.left, self.rect.top),
-            (self.rect.right - 1, self.rect.top),
-            (self.rect.left, self.rect.bottom - 1),
-            (self.rect.right - 1, self.rect.bottom - 1),
-        ]
-        for corner_x, corner_y in corners:
-            tile_x = corner_x // TILE_SIZE
-            tile_y = corner_y // TILE_SIZE
-            if 0 <= tile_x < WORLD_WIDTH and 0 <= tile_y < WORLD_HEIGHT:
-                tile = world[tile_y][tile_x]
-                if is_solid(tile):
-                    if dy > 0:
-                        # Falling – bump head on tile below
-                        self.rect.bottom = tile_y * TILE_SIZE
-                        self.vel_y = 0
-                        self.on_ground = True
-                    elif dy < 0:
-                        # Jumping – bump head on tile above
-                        self.rect.top = (tile_y + 1) * TILE_SIZE
-                        self.vel_y = 0
-                    if dx > 0:
-                        # Moving right – hit left side of tile
-                        self.rect.right = tile_x * TILE_SIZE
-                    elif dx < 0:
-                        # Moving left – hit right side of tile
-                        self.rect.left = (tile_x + 1) * TILE_SIZE
+    def _move_horizontal(self, blocks):
+        self.rect.x = move_horizontal(blocks, self.rect.x, self.rect.y, self.rect.width,
+                                      self.rect.height, fp_to_px(self.vel_x_fp))
+
+    def _move_vertical(self, blocks):
+        self.rect.y, self.vel_y_fp, self.on_ground = move_vertical(
+            blocks, self.rect.x, self.rect.y, self.rect.width, self.rect.height,
+            fp_to_px(self.vel_y_fp), self.vel_y_fp)
 
     def mine_block(self, world, camera, mouse_pos):
-        """Attempt to mine a block under the mouse cursor."""
+        """Attempt to mine a block under the mouse cursor.
+
+        Returns the ``(x, y)`` tile coordinates of the removed block, or None
+        if nothing was mined.
+        """
         # Compute world coordinates of the mouse click
         mx, my = mouse_pos
         world_x = (mx + camera[0]) // TILE_SIZE
@@ -230,26 +489,22 @@ class Player(pygame.sprite.Sprite):
         py = self.rect.centery // TILE_SIZE
         if abs(world_x - px) > 4 or abs(world_y - py) > 4:
             return
-        if 0 <= world_x < WORLD_WIDTH and 0 <= world_y < WORLD_HEIGHT:
-            tile = world[world_y][world_x]
+        if WORLD_RECT.collidepoint(world_x, world_y):
+            tile = world[world_y, world_x]
             # Only mine if not air and not hitting bedrock bottom row (y == WORLD_HEIGHT-1)
             if tile != 0 and world_y < WORLD_HEIGHT - 1:
                 # Add block to inventory
-                if tile == 1:
-                    self.inventory['dirt'] += 1
-                elif tile == 2:
-                    self.inventory['dirt'] += 1
-                elif tile == 3:
-                    self.inventory['stone'] += 1
-                elif tile == 4:
-                    self.inventory['ore'] += 1
-                elif tile == 5:
-                    self.inventory['wood'] += 1
+                self.inventory[TILE_TO_ITEM[tile]] += 1
                 # Remove the block
-                world[world_y][world_x] = 0
+                world[world_y, world_x] = 0
+                return world_x, world_y
 
     def place_block(self, world, camera, mouse_pos):
-        """Attempt to place the currently selected block under the mouse cursor."""
+        """Attempt to place the currently selected block under the mouse cursor.
+
+        Returns the ``(x, y)`` tile coordinates of the placed block, or None
+        if nothing was placed.
+        """
         # Only place if there is at least one of the selected item in inventory
         if self.inventory.get(self.selected, 0) <= 0:
             return
@@ -257,172 +512,170 @@ class Player(pygame.sprite.Sprite):
         world_x = (mx + camera[0]) // TILE_SIZE
         world_y = (my + camera[1]) // TILE_SIZE
         # Check for valid placement
-        if 0 <= world_x < WORLD_WIDTH and 0 <= world_y < WORLD_HEIGHT:
-            if world[world_y][world_x] == 0:
+        if WORLD_RECT.collidepoint(world_x, world_y):
+            if world[world_y, world_x] == 0:
                 # Prevent placing inside the player
                 tile_rect = pygame.Rect(world_x * TILE_SIZE, world_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
                 if not self.rect.colliderect(tile_rect):
-                    # Map item key to tile id
-                    if self.selected == 'dirt':
-                        world[world_y][world_x] = 1
-                    elif self.selected == 'stone':
-                        world[world_y][world_x] = 3
-                        # Use stone tile for placed stone
-                    elif self.selected == 'ore':
-                        world[world_y][world_x] = 4
-                    elif self.selected == 'wood':
-                        world[world_y][world_x] = 5
+                    world[world_y, world_x] = ITEM_TO_TILE[self.selected]
                     # Deduct from inventory
                     self.inventory[self.selected] -= 1
+                    return world_x, world_y
 
     def draw(self, surface, camera):
         # Draw player adjusted for camera
         surface.blit(self.image, (self.rect.x - camera[0], self.rect.y - camera[1]))
 
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x: int, y: int, images: dict[str, pygame.Surface]):
-        super().__init__()
-        self.images = images
-        self.image = images['enemy']
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y
-        self.vel_x = random.choice([-ENEMY_SPEED, ENEMY_SPEED])
-        self.vel_y = 0.0
-        self.on_ground = False
-        self.health = 30
-        self.hurt_cooldown = 0
+class EnemyPool:
+    """All zombies stored as parallel NumPy arrays.
 
-    def update(self, world, player: Player):
-        # Follow the player if horizontal distance is small
-        if player.rect.centerx < self.rect.centerx:
-            self.vel_x = -ENEMY_SPEED
-        else:
-            self.vel_x = ENEMY_SPEED
+    Slot ``i`` is a live enemy while ``active[i]`` is set, and ``live`` holds
+    the indices of those slots so per-frame work never rescans the whole
+    pool.  Positions are the top-left corner of the enemy's rectangle in world
+    pixels.  Updating the whole pool is a handful of vectorised operations
+    plus one compiled movement pass, instead of a Python method call per
+    enemy.
+    """
+
+    def __init__(self, image: pygame.Surface, capacity: int = MAX_ENEMIES):
+        self.image = image
+        self.width, self.height = image.get_size()
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        # Fixed-point velocities (FP_ONE per pixel per frame)
+        self.vel_x_fp = np.zeros(capacity, dtype=np.int32)
+        self.vel_y_fp = np.zeros(capacity, dtype=np.int32)
+        self.on_ground = np.zeros(capacity, dtype=np.bool_)
+        self.health = np.zeros(capacity, dtype=np.int16)
+        self.active = np.zeros(capacity, dtype=np.bool_)
+        self.live = np.zeros(0, dtype=np.intp)
+        self.rng = np.random.default_rng()
+
+    def spawn(self, x: int, y: int):
+        """Add an enemy whose bottom centre is at ``(x, y)``.
+
+        Returns the enemy's slot, or None if the pool is full.
+        """
+        free = np.flatnonzero(~self.active)
+        if len(free) == 0:
+            return None
+        i = int(free[0])
+        self.x[i] = x - self.width // 2
+        self.y[i] = y - self.height
+        self.vel_x_fp[i] = random.choice([-ENEMY_SPEED_FP, ENEMY_SPEED_FP])
+        self.vel_y_fp[i] = 0
+        self.on_ground[i] = False
+        self.health[i] = 30
+        self.active[i] = True
+        self.live = np.flatnonzero(self.active)
+        return i
+
+    def push_out(self, blocks, i: int):
+        """Lift enemy ``i`` until it is clear of solid tiles."""
+        self.y[i] = _push_out(blocks, int(self.x[i]), int(self.y[i]), self.width, self.height,
+                              0, 1, 0)[1]
+
+    def warm_up(self, blocks):
+        """Compile the movement kernel now rather than when the first enemy spawns.
+
+        ``live`` is empty, so nothing moves; this only makes numba specialise
+        ``move_enemies`` for the pool's array types.
+        """
+        move_enemies(blocks, self.live, self.x, self.y, self.vel_x_fp, self.vel_y_fp,
+                     self.on_ground, self.width, self.height)
+
+    def update(self, blocks, player: Player):
+        idx = self.live
+        if len(idx) == 0:
+            return
+        # Follow the player
+        centerx = self.x[idx] + self.width // 2
+        self.vel_x_fp[idx] = np.where(player.rect.centerx < centerx, -ENEMY_SPEED_FP, ENEMY_SPEED_FP)
         # Randomly jump to get past small obstacles
-        if self.on_ground and random.random() < ENEMY_JUMP_CHANCE:
-            self.vel_y = -PLAYER_JUMP * 0.8
-            self.on_ground = False
+        jump = idx[self.on_ground[idx] & (self.rng.random(len(idx)) < ENEMY_JUMP_CHANCE)]
+        self.vel_y_fp[jump] = -ENEMY_JUMP_FP
+        self.on_ground[jump] = False
         # Gravity
-        self.vel_y += GRAVITY
-        # Horizontal move
-        self.rect.x += int(self.vel_x)
-        self._resolve_collisions(world, dx=self.vel_x, dy=0)
-        # Vertical move
-        self.rect.y += int(self.vel_y)
-        self.on_ground = False
-        self._resolve_collisions(world, dx=0, dy=self.vel_y)
-        # Hurt cooldown timer
-        if self.hurt_cooldown > 0:
-            self.hurt_cooldown -= 1
-
-    def _resolve_collisions(self, world, dx: float, dy: float):
-        corners = [
-            (self.rect.left, self.rect.top),
-            (self.rect.right - 1, self.rect.top),
-            (self.rect.left, self.rect.bottom - 1),
-            (self.rect.right - 1, self.rect.bottom - 1),
+        self.vel_y_fp[idx] += GRAVITY_FP
+        move_enemies(blocks, idx, self.x, self.y, self.vel_x_fp, self.vel_y_fp, self.on_ground,
+                     self.width, self.height)
+        # If enemy falls off world or dies, remove by clearing its slot
+        dead = (self.y[idx] > WORLD_HEIGHT * TILE_SIZE) | (self.health[idx] <= 0)
+        if dead.any():
+            self.active[idx[dead]] = False
+            self.live = idx[~dead]
+
+    def colliding(self, rect: pygame.Rect):
+        """Return the indices of live enemies overlapping ``rect``."""
+        idx = self.live
+        x = self.x[idx]
+        y = self.y[idx]
+        return idx[
+            (x < rect.right) & (x + self.width > rect.left)
+            & (y < rect.bottom) & (y + self.height > rect.top)
         ]
-        for corner_x, corner_y in corners:
-            tile_x = corner_x // TILE_SIZE
-            tile_y = corner_y // TILE_SIZE
-            if 0 <= tile_x < WORLD_WIDTH and 0 <= tile_y < WORLD_HEIGHT:
-                tile = world[tile_y][tile_x]
-                if is_solid(tile):
-                    if dy > 0:
-                        # Falling – land on block
-                        self.rect.bottom = tile_y * TILE_SIZE
-                        self.vel_y = 0
-                        self.on_ground = True
-                    elif dy < 0:
-                        self.rect.top = (tile_y + 1) * TILE_SIZE
-                        self.vel_y = 0
-                    if dx > 0:
-                        self.rect.right = tile_x * TILE_SIZE
-                    elif dx < 0:
-                        self.rect.left = (tile_x + 1) * TILE_SIZE
-        # Keep within world bounds
-        if self.rect.left < 0:
-            self.rect.left = 0
-        if self.rect.right > WORLD_WIDTH * TILE_SIZE:
-            self.rect.right = WORLD_WIDTH * TILE_SIZE
+
+    def centerx(self, i: int) -> int:
+        return int(self.x[i]) + self.width // 2
 
     def draw(self, surface, camera):
-        surface.blit(self.image, (self.rect.x - camera[0], self.rect.y - camera[1]))
+        idx = self.live
+        xs = (self.x[idx] - camera[0]).tolist()
+        ys = (self.y[idx] - camera[1]).tolist()
+        surface.blits([(self.image, pos) for pos in zip(xs, ys)], doreturn=False)
 
-    def damage(self, amount: int):
-        self.health -= amount
+    def damage(self, i: int, amount: int):
+        self.health[i] -= amount
 
 
-class Boss(pygame.sprite.Sprite):
+class Boss:
     def __init__(self, x: int, y: int, images: dict[str, pygame.Surface]):
-        super().__init__()
         self.images = images
-        # Boss image is larger; scale to 2× tile size
-        raw_img = images['boss']
-        factor = 2
-        self.image = pygame.transform.smoothscale(raw_img, (TILE_SIZE * factor * 2, TILE_SIZE * factor * 2))
+        # Boss image is loaded pre-scaled to 4× tile size
+        self.image = images['boss']
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
-        self.vel_x = ENEMY_SPEED * 1.5
-        self.vel_y = 0.0
+        # Fixed-point velocity (FP_ONE per pixel per frame)
+        self.vel_x_fp = BOSS_SPEED_FP
+        self.vel_y_fp = 0
         self.on_ground = False
         self.health = 250
         self.hurt_cooldown = 0
 
-    def update(self, world, player: Player):
+    def update(self, blocks, player: Player):
         # Track the player horizontally
         if player.rect.centerx < self.rect.centerx:
-            self.vel_x = -abs(self.vel_x)
+            self.vel_x_fp = -abs(self.vel_x_fp)
         else:
-            self.vel_x = abs(self.vel_x)
+            self.vel_x_fp = abs(self.vel_x_fp)
         # Occasionally jump to overcome obstacles
         if self.on_ground and random.random() < 0.02:
-            self.vel_y = -PLAYER_JUMP  # jump higher
+            self.vel_y_fp = -PLAYER_JUMP_FP  # jump higher
             self.on_ground = False
         # Gravity
-        self.vel_y += GRAVITY
+        self.vel_y_fp += GRAVITY_FP
         # Apply movement
-        self.rect.x += int(self.vel_x)
-        self._resolve_collisions(world, dx=self.vel_x, dy=0)
-        self.rect.y += int(self.vel_y)
-        self.on_ground = False
-        self._resolve_collisions(world, dx=0, dy=self.vel_y)
+        self._move_horizontal(blocks)
+        self._move_vertical(blocks)
         if self.hurt_cooldown > 0:
             self.hurt_cooldown -= 1
 
-    def _resolve_collisions(self, world, dx: float, dy: float):
-        corners = [
-            (self.rect.left, self.rect.top),
-            (self.rect.right - 1, self.rect.top),
-            (self.rect.left, self.rect.bottom - 1),
-            (self.rect.right - 1, self.rect.bottom - 1),
-        ]
-        for corner_x, corner_y in corners:
-            tile_x = corner_x // TILE_SIZE
-            tile_y = corner_y // TILE_SIZE
-            if 0 <= tile_x < WORLD_WIDTH and 0 <= tile_y < WORLD_HEIGHT:
-                tile = world[tile_y][tile_x]
-                if is_solid(tile):
-                    if dy > 0:
-                        self.rect.bottom = tile_y * TILE_SIZE
-                        self.vel_y = 0
-                        self.on_ground = True
-                    elif dy < 0:
-                        self.rect.top = (tile_y + 1) * TILE_SIZE
-                        self.vel_y = 0
-                    if dx > 0:
-                        self.rect.right = tile_x * TILE_SIZE
-                    elif dx < 0:
-                        self.rect.left = (tile_x + 1) * TILE_SIZE
+    def _move_horizontal(self, blocks):
+        self.rect.x = move_horizontal(blocks, self.rect.x, self.rect.y, self.rect.width,
+                                      self.rect.height, fp_to_px(self.vel_x_fp))
         # Keep within world bounds
         if self.rect.left < 0:
             self.rect.left = 0
         if self.rect.right > WORLD_WIDTH * TILE_SIZE:
             self.rect.right = WORLD_WIDTH * TILE_SIZE
 
+    def _move_vertical(self, blocks):
+        self.rect.y, self.vel_y_fp, self.on_ground = move_vertical(
+            blocks, self.rect.x, self.rect.y, self.rect.width, self.rect.height,
+            fp_to_px(self.vel_y_fp), self.vel_y_fp)
+
     def draw(self, surface, camera):
         surface.blit(self.image, (self.rect.x - camera[0], self.rect.y - camera[1]))
 
@@ -434,47 +687,127 @@ class Boss(pygame.sprite.Sprite):
 # Rendering and UI
 #
 
-def draw_world(surface, world, images, camera):
-    """Draw the visible portion of the world based on the camera offset."""
-    screen_tiles_x = (SCREEN_WIDTH // TILE_SIZE) + 2
-    screen_tiles_y = (SCREEN_HEIGHT // TILE_SIZE) + 2
-    start_x = camera[0] // TILE_SIZE
-    start_y = camera[1] // TILE_SIZE
-    for y in range(start_y, start_y + screen_tiles_y):
-        if 0 <= y < WORLD_HEIGHT:
-            for x in range(start_x, start_x + screen_tiles_x):
-                if 0 <= x < WORLD_WIDTH:
-                    tile = world[y][x]
-                    if tile != 0:
-                        # Map tile ids to image keys
-                        if tile == 1:
-                            img = images['dirt']
-                        elif tile == 2:
-                            img = images['grass']
-                        elif tile == 3:
-                            img = images['stone']
-                        elif tile == 4:
-                            img = images['ore']
-                        elif tile == 5:
-                            img = images['wood']
-                        else:
-                            img = None
-                        if img:
-                            surface.blit(img, (x * TILE_SIZE - camera[0], y * TILE_SIZE - camera[1]))
-
-
-def draw_inventory(surface, player: Player, images):
-    """Draw a simple hotbar at the bottom of the screen."""
+def draw_world(surface, world, tile_images, camera, size=None):
+    """Draw the visible portion of the world based on the camera offset.
+
+    ``tile_images`` is a list indexed by tile id; only the non-air cells of
+    the visible window are collected and handed to ``Surface.blits`` in one
+    batch.  ``size`` is the ``(columns, rows)`` of tiles to draw and defaults
+    to enough tiles to cover the screen.
+    """
+    if size is None:
+        size = ((SCREEN_WIDTH // TILE_SIZE) + 2, (SCREEN_HEIGHT // TILE_SIZE) + 2)
+    screen_tiles_x, screen_tiles_y = size
+    start_x = max(0, camera[0] // TILE_SIZE)
+    start_y = max(0, camera[1] // TILE_SIZE)
+    view = world[start_y:start_y + screen_tiles_y, start_x:start_x + screen_tiles_x]
+    # Screen position of every visible column/row, computed once per frame
+    xs = (np.arange(start_x, start_x + view.shape[1]) * TILE_SIZE - camera[0]).tolist()
+    ys = (np.arange(start_y, start_y + view.shape[0]) * TILE_SIZE - camera[1]).tolist()
+    rows, cols = np.nonzero(view)
+    tiles = view[rows, cols].tolist()
+    surface.blits(
+        [(tile_images[tile], (xs[x], ys[y])) for y, x, tile in zip(rows.tolist(), cols.tolist(), tiles)],
+        doreturn=False,
+    )
+
+
+class WorldRenderer:
+    """Cache the world as pre-rendered chunk surfaces.
+
+    Each chunk covers ``CHUNK_SIZE`` × ``CHUNK_SIZE`` tiles and is rendered the
+    first time it becomes visible.  Afterwards only tiles that change are
+    redrawn, so a frame costs one blit per visible chunk instead of one per
+    tile.  At most ``MAX_CACHED_CHUNKS`` surfaces are kept; the least recently
+    drawn one is recycled for the next chunk, so memory stays flat however
+    large the world is.
+    """
+
+    def __init__(self, world, tile_images):
+        self.world = world
+        self.tile_images = tile_images
+        self.chunks = OrderedDict()
+        self.chunk_px = CHUNK_SIZE * TILE_SIZE
+        height, width = world.shape
+        self.chunks_x = -(-width // CHUNK_SIZE)
+        self.chunks_y = -(-height // CHUNK_SIZE)
+
+    def _get_chunk(self, cx, cy):
+        chunk = self.chunks.get((cx, cy))
+        if chunk is not None:
+            self.chunks.move_to_end((cx, cy))
+            return chunk
+        if len(self.chunks) >= MAX_CACHED_CHUNKS:
+            # Reuse the surface of the least recently drawn chunk
+            _, chunk = self.chunks.popitem(last=False)
+        else:
+            # Opaque and in display format so it blits without per-pixel
+            # alpha; air is left transparent through the colorkey instead
+            chunk = pygame.Surface((self.chunk_px, self.chunk_px)).convert()
+            chunk.set_colorkey(CHUNK_COLORKEY)
+        chunk.fill(CHUNK_COLORKEY)
+        draw_world(chunk, self.world, self.tile_images,
+                   (cx * self.chunk_px, cy * self.chunk_px), (CHUNK_SIZE, CHUNK_SIZE))
+        self.chunks[cx, cy] = chunk
+        return chunk
+
+    def redraw_tile(self, x, y):
+        """Refresh a single tile after the world changed at ``(x, y)``."""
+        chunk = self.chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE))
+        if chunk is None:
+            # Not cached; it will pick up the change when next drawn
+            return
+        tile_rect = pygame.Rect((x % CHUNK_SIZE) * TILE_SIZE, (y % CHUNK_SIZE) * TILE_SIZE,
+                                TILE_SIZE, TILE_SIZE)
+        chunk.fill(CHUNK_COLORKEY, tile_rect)
+        tile = self.world[y, x]
+        if tile != 0:
+            chunk.blit(self.tile_images[tile], tile_rect)
+
+    def draw(self, surface, camera):
+        """Blit every chunk overlapping the screen."""
+        first_cx = max(0, camera[0] // self.chunk_px)
+        first_cy = max(0, camera[1] // self.chunk_px)
+        last_cx = min(self.chunks_x - 1, (camera[0] + SCREEN_WIDTH - 1) // self.chunk_px)
+        last_cy = min(self.chunks_y - 1, (camera[1] + SCREEN_HEIGHT - 1) // self.chunk_px)
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                surface.blit(self._get_chunk(cx, cy),
+                             (cx * self.chunk_px - camera[0], cy * self.chunk_px - camera[1]))
+
+
+def sky_height(world, camera):
+    """Return how many screen rows from the top can show sky.
+
+    Everything below the deepest visible row that contains an air tile is
+    fully covered by tiles, so the sky fill can stop there.
+    """
+    start_x = max(0, camera[0] // TILE_SIZE)
+    start_y = max(0, camera[1] // TILE_SIZE)
+    view = world[start_y:start_y + (SCREEN_HEIGHT // TILE_SIZE) + 2,
+                 start_x:start_x + (SCREEN_WIDTH // TILE_SIZE) + 2]
+    air_rows = np.flatnonzero((view == 0).any(axis=1))
+    if len(air_rows) == 0:
+        return 0
+    bottom = (start_y + int(air_rows[-1]) + 1) * TILE_SIZE - camera[1]
+    return max(0, min(SCREEN_HEIGHT, bottom))
+
+
+def draw_inventory(surface, player: Player, icons, font, count_surfs):
+    """Draw a simple hotbar at the bottom of the screen.
+
+    ``icons`` maps item keys to pre-scaled icons and ``count_surfs`` holds
+    pre-rendered count labels; larger counts are rendered with ``font``.
+    """
     bar_height = 40
     y = SCREEN_HEIGHT - bar_height
     pygame.draw.rect(surface, (0, 0, 0, 180), (0, y, SCREEN_WIDTH, bar_height))
-    font = pygame.font.SysFont('arial', 16)
-    # Define order of items in hotbar
-    items = ['dirt', 'stone', 'ore', 'wood']
     slot_size = 40
     padding = 5
     x_offset = 10
-    for idx, item_key in enumerate(items):
+    # Icons and counts are collected and blitted in one batch after the slots
+    sprites = []
+    for idx, item_key in enumerate(HOTBAR_ITEMS):
         rect = pygame.Rect(x_offset + idx * (slot_size + padding), y + 5, slot_size, slot_size)
         # Highlight selected slot
         if player.selected == item_key:
@@ -482,19 +815,16 @@ def draw_inventory(surface, player: Player, images):
         # Draw background
         pygame.draw.rect(surface, (80, 80, 80), rect)
         # Draw item icon (scaled block texture)
-        if item_key == 'dirt':
-            icon = pygame.transform.smoothscale(images['dirt'], (slot_size - 8, slot_size - 8))
-        elif item_key == 'stone':
-            icon = pygame.transform.smoothscale(images['stone'], (slot_size - 8, slot_size - 8))
-        elif item_key == 'ore':
-            icon = pygame.transform.smoothscale(images['ore'], (slot_size - 8, slot_size - 8))
-        elif item_key == 'wood':
-            icon = pygame.transform.smoothscale(images['wood'], (slot_size - 8, slot_size - 8))
-        surface.blit(icon, (rect.x + 4, rect.y + 4))
+        sprites.append((icons[item_key], (rect.x + 4, rect.y + 4)))
         # Draw count
         count = player.inventory[item_key]
-        count_surf = font.render(str(count), True, (255, 255, 255))
-        surface.blit(count_surf, (rect.right - count_surf.get_width() - 4, rect.bottom - count_surf.get_height() - 4))
+        if count < len(count_surfs):
+            count_surf = count_surfs[count]
+        else:
+            count_surf = font.render(str(count), True, (255, 255, 255))
+        sprites.append((count_surf, (rect.right - count_surf.get_width() - 4,
+                                     rect.bottom - count_surf.get_height() - 4)))
+    surface.blits(sprites, doreturn=False)
 
 
 def draw_health(surface, player: Player):
@@ -528,35 +858,70 @@ def run_game():
         'stone': load_image('stone.png', (TILE_SIZE, TILE_SIZE)),
         'ore': load_image('ore.png', (TILE_SIZE, TILE_SIZE)),
         'wood': load_image('wood.png', (TILE_SIZE, TILE_SIZE)),
-        'player': load_image('player.png', (TILE_SIZE, int(TILE_SIZE * 1.5))),
-        'enemy': load_image('enemy.png', (TILE_SIZE, int(TILE_SIZE * 1.5))),
-        'boss': load_image('boss.png'),
+        'player': load_image('player.png', (TILE_SIZE, int(TILE_SIZE * 1.5)), alpha=True),
+        'enemy': load_image('enemy.png', (TILE_SIZE, int(TILE_SIZE * 1.5)), alpha=True),
+        'boss': load_image('boss.png', (TILE_SIZE * 4, TILE_SIZE * 4), alpha=True, smooth=True),
     }
+    # Tile images indexed by tile id for fast lookup while drawing
+    tile_images = [images[name] if name else None for name in TILE_NAMES]
 
     # Generate the world
     world = generate_world(WORLD_WIDTH, WORLD_HEIGHT)
+    world_renderer = WorldRenderer(world, tile_images)
+    # Topmost solid tile of every column, used to place spawns on the ground
+    ground_y = find_ground(world)
+    # Copy of the world in the block layout used for collision
+    world_blocks = to_blocks(world)
+
 
     # Create player at surface level near the left side
-    # Find ground height at x coordinate 5
-    ground_y = 0
-    for y in range(WORLD_HEIGHT):
-        if world[y][5] != 0:
-            ground_y = y
-            break
-    player = Player(5 * TILE_SIZE, ground_y * TILE_SIZE, images)
-
-    # Enemy group
-    enemies = pygame.sprite.Group()
+    player_width = images['player'].get_width()
+    player = Player(5 * TILE_SIZE, spawn_ground(ground_y, 5 * TILE_SIZE, player_width), images)
+    push_out_rect(world_blocks, player.rect)
+
+    # Enemy pool
+    enemies = EnemyPool(images['enemy'])
+    enemies.warm_up(world_blocks)
     enemy_spawn_timer = 0
     # Boss
     boss = None
     boss_spawned = False
     boss_defeated = False
 
+    def tile_changed(x, y):
+        """Propagate an edit of world tile ``(x, y)`` to the derived data."""
+        world_renderer.redraw_tile(x, y)
+        update_ground(ground_y, world, x)
+        update_block(world_blocks, world, x, y)
+        if world[y, x] != 0:
+            # A placed block can end up inside an enemy or the boss
+            tile_rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            for i in enemies.colliding(tile_rect):
+                enemies.push_out(world_blocks, i)
+            if boss and not boss_defeated and boss.rect.colliderect(tile_rect):
+                push_out_rect(world_blocks, boss.rect)
+
     # Day/night timer
     time_of_day = 0
     day_count = 0
+    # Sky colour for every frame of the cycle: a gradient between night and day.
+    # t in [0,1] mapping: 0 = dawn, 0.5 = dusk; we oscillate
+    t = np.arange(DAY_LENGTH) / DAY_LENGTH
+    brightness = 0.5 + 0.5 * (1 - np.abs(0.5 - t) * 2)
+    day_color = np.array([100, 150, 255])
+    night_color = np.array([20, 30, 70])
+    sky_colors = [tuple(c) for c in
+                  (night_color + (day_color - night_color) * brightness[:, None]).astype(int).tolist()]
+    # Enemies spawn while it is dark
+    night_frames = (brightness < 0.5).tolist()
     font = pygame.font.SysFont('arial', 20)
+    # Hotbar assets are built once rather than every frame
+    inventory_font = pygame.font.SysFont('arial', 16)
+    hotbar_icons = {
+        key: pygame.transform.scale(images[key], (HOTBAR_ICON_SIZE, HOTBAR_ICON_SIZE))
+        for key in HOTBAR_ITEMS
+    }
+    count_surfs = [inventory_font.render(str(n), True, (255, 255, 255)) for n in range(100)]
 
     # Story message timer
     story_timer = 600  # frames (~10 seconds at 60fps)
@@ -569,18 +934,24 @@ def run_game():
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWFOCUSLOST):
+                player.handle_event(event)
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # Left click – mine block
-                player.mine_block(world, (camera_x, camera_y), event.pos)
+                changed = player.mine_block(world, (camera_x, camera_y), event.pos)
+                if changed:
+                    tile_changed(*changed)
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
                 # Right click – place block
-                player.place_block(world, (camera_x, camera_y), event.pos)
+                changed = player.place_block(world, (camera_x, camera_y), event.pos)
+                if changed:
+                    tile_changed(*changed)
 
-        # Handle keyboard input continuously
+        # Apply the keys held this frame
         player.handle_input()
 
         # Update player
-        player.update(world)
+        player.update(world_blocks)
         # Update camera (center on player)
         camera_x = player.rect.centerx - SCREEN_WIDTH // 2
         camera_y = player.rect.centery - SCREEN_HEIGHT // 2
@@ -593,21 +964,10 @@ def run_game():
         if time_of_day >= DAY_LENGTH:
             time_of_day = 0
             day_count += 1
-        # Determine sky color (simple gradient between day and night)
-        t = time_of_day / DAY_LENGTH
-        # t in [0,1] mapping: 0 = dawn, 0.5 = dusk; we oscillate
-        brightness = 0.5 + 0.5 * (1 - abs(0.5 - t) * 2)
-        day_color = pygame.Color(100, 150, 255)
-        night_color = pygame.Color(20, 30, 70)
-        # Linear interpolation between night and day based on brightness
-        sky_color = (
-            int(night_color.r + (day_color.r - night_color.r) * brightness),
-            int(night_color.g + (day_color.g - night_color.g) * brightness),
-            int(night_color.b + (day_color.b - night_color.b) * brightness),
-        )
+        sky_color = sky_colors[time_of_day]
 
         # Enemy spawning at night
-        is_night = brightness < 0.5
+        is_night = night_frames[time_of_day]
         if is_night and not boss_defeated:
             enemy_spawn_timer += 1
             if enemy_spawn_timer >= ENEMY_SPAWN_INTERVAL:
@@ -616,60 +976,47 @@ def run_game():
                 spawn_x = random.randint(0, WORLD_WIDTH - 1)
                 # Avoid spawning right on top of player
                 if abs(spawn_x - player.rect.centerx // TILE_SIZE) > 10:
-                    # Find ground
-                    for y in range(WORLD_HEIGHT):
-                        if world[y][spawn_x] != 0:
-                            spawn_y = y
-                            break
-                    # Spawn enemy slightly above ground
-                    enemy = Enemy(spawn_x * TILE_SIZE, spawn_y * TILE_SIZE, images)
-                    enemies.add(enemy)
+                    spawn_px = spawn_x * TILE_SIZE
+                    i = enemies.spawn(spawn_px, spawn_ground(ground_y, spawn_px, enemies.width))
+                    if i is not None:
+                        enemies.push_out(world_blocks, i)
 
         # Spawn boss if conditions met
         if not boss_spawned and player.inventory['ore'] >= BOSS_SPAWN_ORE_COUNT:
             # Spawn boss near the player
             bx = player.rect.centerx
-            # Find ground at player's x
-            gx = bx // TILE_SIZE
-            gy = 0
-            for y in range(WORLD_HEIGHT):
-                if world[y][int(gx)] != 0:
-                    gy = y
-                    break
-            boss = Boss(bx, gy * TILE_SIZE, images)
+            # Stand on the tallest column under the boss's feet
+            boss = Boss(bx, spawn_ground(ground_y, bx, images['boss'].get_width()), images)
+            push_out_rect(world_blocks, boss.rect)
             boss_spawned = True
             show_story = True
             story_timer = 600
 
         # Update enemies
-        for enemy in list(enemies):
-            enemy.update(world, player)
-            # Damage player on collision
-            if enemy.rect.colliderect(player.rect):
-                if player.hurt_cooldown == 0:
-                    player.health -= 10
-                    player.hurt_cooldown = 60  # invincibility frames
-                    # Knockback player slightly
-                    if enemy.rect.centerx < player.rect.centerx:
-                        player.vel_x += 2
-                    else:
-                        player.vel_x -= 2
-            # If enemy falls off world or dies, remove
-            if enemy.rect.top > WORLD_HEIGHT * TILE_SIZE or enemy.health <= 0:
-                enemies.remove(enemy)
+        enemies.update(world_blocks, player)
+        # Damage player on collision
+        for i in enemies.colliding(player.rect):
+            if player.hurt_cooldown == 0:
+                player.health -= 10
+                player.hurt_cooldown = 60  # invincibility frames
+                # Knockback player slightly
+                if enemies.centerx(i) < player.rect.centerx:
+                    player.vel_x_fp += 2 * FP_ONE
+                else:
+                    player.vel_x_fp -= 2 * FP_ONE
 
         # Update boss
         if boss and not boss_defeated:
-            boss.update(world, player)
+            boss.update(world_blocks, player)
             # Damage player on collision
             if boss.rect.colliderect(player.rect):
                 if player.hurt_cooldown == 0:
                     player.health -= 20
                     player.hurt_cooldown = 60
                     if boss.rect.centerx < player.rect.centerx:
-                        player.vel_x += 4
+                        player.vel_x_fp += 4 * FP_ONE
                     else:
-                        player.vel_x -= 4
+                        player.vel_x_fp -= 4 * FP_ONE
             # Remove boss if defeated
             if boss.health <= 0:
                 boss_defeated = True
@@ -681,17 +1028,16 @@ def run_game():
             running = False
 
         # Clear screen
-        screen.fill(sky_color)
+        screen.fill(sky_color, (0, 0, SCREEN_WIDTH, sky_height(world, (camera_x, camera_y))))
         # Draw world
-        draw_world(screen, world, images, (camera_x, camera_y))
+        world_renderer.draw(screen, (camera_x, camera_y))
         # Draw entities
         player.draw(screen, (camera_x, camera_y))
-        for enemy in enemies:
-            enemy.draw(screen, (camera_x, camera_y))
+        enemies.draw(screen, (camera_x, camera_y))
         if boss and not boss_defeated:
             boss.draw(screen, (camera_x, camera_y))
         # Draw UI
-        draw_inventory(screen, player, images)
+        draw_inventory(screen, player, hotbar_icons, inventory_font, count_surfs)
         draw_health(screen, player)
 
         # Draw story text
@@ -0,0 +1,90 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+import pytest
+
+import game
+
+
+def slope_world():
+    """Ground at row 30 that steps up one tile for columns 0-3."""
+    world = np.zeros((game.WORLD_HEIGHT, game.WORLD_WIDTH), dtype=np.uint8)
+    world[30:, :] = 1
+    world[29, :4] = 1
+    return world
+
+
+def overlaps_terrain(world, rect):
+    rows = slice(max(0, rect.top // game.TILE_SIZE), (rect.bottom - 1) // game.TILE_SIZE + 1)
+    cols = slice(max(0, rect.left // game.TILE_SIZE), (rect.right - 1) // game.TILE_SIZE + 1)
+    return bool(world[rows, cols].any())
+
+
+class StillPlayer:
+    rect = pygame.Rect(50 * game.TILE_SIZE, 0, 32, 48)
+
+
+@pytest.fixture(autouse=True)
+def no_random_jumps(monkeypatch):
+    monkeypatch.setattr(game.random, 'random', lambda: 1.0)
+    monkeypatch.setattr(game, 'ENEMY_JUMP_CHANCE', 0.0)
+
+
+@pytest.mark.parametrize('kind', ['player', 'boss'])
+def test_spawn_on_slope_starts_clear(kind):
+    world = slope_world()
+    blocks = game.to_blocks(world)
+    ground_y = game.find_ground(world)
+    images = {'player': pygame.Surface((32, 48)), 'boss': pygame.Surface((128, 128))}
+    # Centred on column 4, so the rect also covers the taller columns
+    centerx = 4 * game.TILE_SIZE
+    bottom = game.spawn_ground(ground_y, centerx, images[kind].get_width())
+    if kind == 'player':
+        entity = game.Player(centerx, bottom, images)
+    else:
+        entity = game.Boss(centerx, bottom, images)
+        entity.vel_x_fp = 0
+    assert not overlaps_terrain(world, entity.rect)
+    for _ in range(3):
+        if kind == 'player':
+            entity.update(blocks)
+        else:
+            entity.update(blocks, StillPlayer())
+    assert not overlaps_terrain(world, entity.rect)
+    assert entity.rect.bottom == 29 * game.TILE_SIZE
+
+
+def test_enemy_spawn_on_slope_starts_clear():
+    world = slope_world()
+    blocks = game.to_blocks(world)
+    ground_y = game.find_ground(world)
+    pool = game.EnemyPool(pygame.Surface((32, 48)), capacity=4)
+    centerx = 4 * game.TILE_SIZE
+    i = pool.spawn(centerx, game.spawn_ground(ground_y, centerx, pool.width))
+    pool.update(blocks, StillPlayer())
+    pool.update(blocks, StillPlayer())
+    rect = pygame.Rect(int(pool.x[i]), int(pool.y[i]), pool.width, pool.height)
+    assert not overlaps_terrain(world, rect)
+
+
+def test_placed_block_pushes_entities_out():
+    world = np.zeros((game.WORLD_HEIGHT, game.WORLD_WIDTH), dtype=np.uint8)
+    world[30:, :] = 1
+    blocks = game.to_blocks(world)
+    pool = game.EnemyPool(pygame.Surface((32, 48)), capacity=4)
+    i = pool.spawn(10 * game.TILE_SIZE + 16, 30 * game.TILE_SIZE)
+    boss = game.Boss(20 * game.TILE_SIZE, 30 * game.TILE_SIZE,
+                     {'boss': pygame.Surface((128, 128))})
+    # Place a block under the left foot of each; the boss covers columns 18-21
+    for x in (10, 18):
+        world[29, x] = 1
+        game.update_block(blocks, world, x, 29)
+    pool.push_out(blocks, i)
+    game.push_out_rect(blocks, boss.rect)
+    rect = pygame.Rect(int(pool.x[i]), int(pool.y[i]), pool.width, pool.height)
+    for rect in (rect, boss.rect):
+        assert not overlaps_terrain(world, rect)
+        assert rect.bottom == 29 * game.TILE_SIZE
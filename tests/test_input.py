@@ -0,0 +1,40 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+import game
+
+
+def key_event(kind, key):
+    return pygame.event.Event(kind, key=key, mod=0, unicode='', scancode=0)
+
+
+def step(player, blocks):
+    player.handle_input()
+    player.update(blocks)
+
+
+def test_every_jump_tap_while_standing_jumps():
+    world = np.zeros((game.WORLD_HEIGHT, game.WORLD_WIDTH), dtype=np.uint8)
+    world[30:, :] = 1
+    blocks = game.to_blocks(world)
+    images = {'player': pygame.Surface((32, 48))}
+    player = game.Player(50 * game.TILE_SIZE, 30 * game.TILE_SIZE, images)
+    jumps = 0
+    for tap in range(20):
+        # Let the player land, then tap on alternating frames so both
+        # values of the flickering on_ground are hit
+        for _ in range(120 + tap % 2):
+            step(player, blocks)
+        # Press and release within the same frame
+        player.handle_event(key_event(pygame.KEYDOWN, pygame.K_SPACE))
+        player.handle_event(key_event(pygame.KEYUP, pygame.K_SPACE))
+        for _ in range(game.JUMP_BUFFER_FRAMES):
+            step(player, blocks)
+            if player.vel_y_fp < 0:
+                jumps += 1
+                break
+    assert jumps == 20